@@ -19,14 +19,23 @@ st.set_page_config(page_title=APP_TITLE, page_icon="🎂", layout="centered")
 st.title(APP_TITLE)
 st.caption("Counting down to September 26, 2025 (Eastern Time) 🎂")
 
-st_autorefresh(interval=1000, key="countdown_refresh")
-
 days, hours, minutes, seconds = get_countdown(TARGET_DATE)
 
+# Refresh every second only in the final ~2 hours; otherwise (including
+# once the date has passed) once a minute
+final_stretch = days == 0 and hours <= 1
+refresh_ms = 1000 if final_stretch else 60000
+st_autorefresh(interval=refresh_ms, key="countdown_refresh")
+
+# Seconds would sit frozen between minute refreshes, so only show them up close
+countdown = f"{days} days, {hours} hours, {minutes} minutes"
+if final_stretch:
+    countdown += f", {seconds} seconds"
+
 st.markdown(
     f"""
     ## ⏳ Countdown
-    **{days} days, {hours} hours, {minutes} minutes, {seconds} seconds**
+    **{countdown}**
     until the big day! 🎉
     """
 )